@@ -1,157 +1,316 @@
 import argparse
 import random
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Tuple
 
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from faker import Faker
 
-CATEGORIES = ["electronics", "fashion", "home", "beauty", "books", "sports"]
-ORDER_STATUSES = ["pending", "completed", "cancelled"]
-PAYMENT_METHODS = ["credit_card", "debit_card", "upi", "net_banking"]
-PAYMENT_STATUSES = ["successful", "failed", "pending"]
+try:
+    from numba import njit
+except ImportError:  # numba is optional; generate_order_items falls back to numpy
+    njit = None
 
+import ingest_to_sqlite
 
-def generate_users(num_users: int, faker: Faker) -> pd.DataFrame:
+# Object-dtype pools: drawing codes and indexing these means every generated
+# row references one of the few pool strings instead of carrying its own
+# fixed-width unicode copy.
+CATEGORIES = np.array(
+    ["electronics", "fashion", "home", "beauty", "books", "sports"], dtype=object
+)
+ORDER_STATUSES = np.array(["pending", "completed", "cancelled"], dtype=object)
+PAYMENT_METHODS = np.array(
+    ["credit_card", "debit_card", "upi", "net_banking"], dtype=object
+)
+PAYMENT_STATUSES = np.array(["successful", "failed", "pending"], dtype=object)
+
+
+def _choice_pooled(pool, size, rng, p=None):
+    return pool[rng.choice(len(pool), size=size, p=p)]
+
+
+# Fixed shard count for the PII worker pool: sizing it from os.cpu_count()
+# would make --seed output vary by machine, since each shard consumes its
+# own Faker stream.
+N_PII_SHARDS = 8
+
+# Faker instance for PII workers. Kept as a module global so each child
+# process builds it once and reuses it across calls instead of pickling it.
+_worker_faker = None
+
+
+def _generate_pii_shard(args: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    worker_id, count, master_seed = args
+
+    global _worker_faker
+    if _worker_faker is None:
+        _worker_faker = Faker()
+    _worker_faker.seed_instance(master_seed + worker_id)
+    _worker_faker.unique.clear()
+
+    names = [_worker_faker.name() for _ in range(count)]
+
+    # Emails are only unique within a shard; stamping the worker id into
+    # each value makes them unique across shards too. The non-digit ".w"
+    # separator keeps the suffix from aliasing into locals that already end
+    # in digits (local "john1" + worker 0 vs local "john" + worker 10).
+    emails = []
+    for _ in range(count):
+        local, _sep, domain = _worker_faker.unique.email().partition("@")
+        emails.append(f"{local}.w{worker_id}@{domain}")
+
+    return (
+        np.array(names, dtype=object),
+        np.array(emails, dtype=object),
+    )
+
+
+def generate_users(
+    num_users: int, master_seed: int, rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
     print(f"Generating {num_users} users...")
-    users = []
-
-    for user_id in range(1, num_users + 1):
-        full_name = faker.name()
-        email = faker.unique.email()
-        phone = faker.unique.msisdn()
-        signup_date = faker.date_between(start_date="-2y", end_date="today")
-
-        users.append(
-            {
-                "user_id": user_id,
-                "full_name": full_name,
-                "email": email,
-                "signup_date": signup_date,
-                "phone_number": phone,
-            }
+
+    user_ids = np.arange(1, num_users + 1)
+
+    n_workers = min(N_PII_SHARDS, num_users)
+    counts = [
+        num_users // n_workers + (1 if i < num_users % n_workers else 0)
+        for i in range(n_workers)
+    ]
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        shards = list(
+            pool.map(
+                _generate_pii_shard,
+                [(i, counts[i], master_seed) for i in range(n_workers)],
+            )
         )
 
-    faker.unique.clear()
-    return pd.DataFrame(users)
+    names = np.concatenate([s[0] for s in shards])
+    emails = np.concatenate([s[1] for s in shards])
 
+    # MSISDNs derived from the (unique) user_id: a country prefix plus the
+    # zero-padded id gives a 13-digit number with no uniqueness bookkeeping.
+    phones = np.char.add("91", np.char.zfill(user_ids.astype(str), 11))
 
-def generate_products(num_products: int, faker: Faker) -> pd.DataFrame:
+    start = (date.today() - timedelta(days=730)).toordinal()
+    end = date.today().toordinal()
+    ordinals = rng.integers(start, end + 1, size=num_users)
+    signup_dates = np.array([date.fromordinal(int(o)) for o in ordinals], dtype=object)
+
+    return {
+        "user_id": user_ids,
+        "full_name": names,
+        "email": emails,
+        "signup_date": signup_dates,
+        "phone_number": phones,
+    }
+
+
+def generate_products(
+    num_products: int, faker: Faker, rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
     print(f"Generating {num_products} products...")
-    products = []
-    for product_id in range(1, num_products + 1):
-        category = random.choice(CATEGORIES)
-        base_price = round(random.uniform(5.0, 500.0), 2)
-        products.append(
-            {
-                "product_id": product_id,
-                "product_name": f"{faker.color_name()} {faker.word().title()}",
-                "category": category,
-                "price": base_price,
-                "stock_quantity": random.randint(0, 500),
-            }
-        )
-    return pd.DataFrame(products)
 
+    categories = _choice_pooled(CATEGORIES, num_products, rng)
+    prices = np.round(rng.uniform(5.0, 500.0, size=num_products), 2)
+    stock_quantities = rng.integers(0, 501, size=num_products)
 
-def generate_orders(num_orders: int, users_df: pd.DataFrame, faker: Faker) -> pd.DataFrame:
+    product_names = np.empty(num_products, dtype=object)
+    for i in range(num_products):
+        product_names[i] = f"{faker.color_name()} {faker.word().title()}"
+
+    return {
+        "product_id": np.arange(1, num_products + 1),
+        "product_name": product_names,
+        "category": categories,
+        "price": prices,
+        "stock_quantity": stock_quantities,
+    }
+
+
+def generate_orders(
+    num_orders: int, users: Dict[str, np.ndarray], rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
     print(f"Generating {num_orders} orders...")
-    orders = []
-    for order_id in range(1, num_orders + 1):
-        user = users_df.sample(1).iloc[0]
-        order_date = faker.date_between(
-            start_date=user["signup_date"], end_date="today"
-        )
-        order_status = random.choices(ORDER_STATUSES, weights=[0.2, 0.7, 0.1])[0]
-        orders.append(
-            {
-                "order_id": order_id,
-                "user_id": int(user["user_id"]),
-                "order_date": order_date,
-                "total_amount": 0.0,
-                "order_status": order_status,
-            }
-        )
-    return pd.DataFrame(orders)
 
+    uid_arr = np.asarray(users["user_id"])
+    signup_arr = np.asarray(users["signup_date"], dtype=object)
 
-def generate_order_items(
-    orders_df: pd.DataFrame, products_df: pd.DataFrame
-) -> Tuple[pd.DataFrame, pd.Series]:
-    print("Generating order items...")
-    order_totals = defaultdict(float)
-    items = []
-    item_id = 1
-
-    for _, order in orders_df.iterrows():
-        num_items = random.randint(1, 5)
-        selected_products = products_df.sample(num_items, replace=True)
-
-        for _, product in selected_products.iterrows():
-            quantity = random.randint(1, 5)
-            unit_price = round(
-                random.uniform(product["price"] * 0.9, product["price"] * 1.1), 2
-            )
-            line_total = round(quantity * unit_price, 2)
-
-            items.append(
-                {
-                    "item_id": item_id,
-                    "order_id": int(order["order_id"]),
-                    "product_id": int(product["product_id"]),
-                    "quantity": quantity,
-                    "unit_price": unit_price,
-                    "line_total": line_total,
-                }
+    idx = rng.integers(0, len(uid_arr), size=num_orders)
+    user_ids = uid_arr[idx]
+
+    # toordinal once per user rather than once per sampled order; the
+    # per-order values are then just an index into the precomputed array.
+    signup_ord_all = np.fromiter(
+        (d.toordinal() for d in signup_arr), dtype=np.int64, count=len(signup_arr)
+    )
+    signup_ord = signup_ord_all[idx]
+
+    today_ord = date.today().toordinal()
+    order_ordinals = rng.integers(signup_ord, today_ord + 1)
+    order_dates = np.array(
+        [date.fromordinal(int(o)) for o in order_ordinals], dtype=object
+    )
+
+    order_statuses = _choice_pooled(
+        ORDER_STATUSES, num_orders, rng, p=[0.2, 0.7, 0.1]
+    )
+
+    return {
+        "order_id": np.arange(1, num_orders + 1),
+        "user_id": user_ids,
+        "order_date": order_dates,
+        "total_amount": np.zeros(num_orders),
+        "order_status": order_statuses,
+    }
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _price_kernel(prices, seed):
+        # Kept sequential rather than parallel so a fixed seed keeps
+        # producing the same rows.
+        np.random.seed(seed)
+        n = prices.shape[0]
+        quantities = np.empty(n, dtype=np.int64)
+        unit_prices = np.empty(n)
+        line_totals = np.empty(n)
+        for i in range(n):
+            quantities[i] = np.random.randint(1, 6)
+            unit_prices[i] = round(
+                np.random.uniform(prices[i] * 0.9, prices[i] * 1.1), 2
             )
+            line_totals[i] = round(quantities[i] * unit_prices[i], 2)
+        return quantities, unit_prices, line_totals
 
-            order_totals[order["order_id"]] += line_total
-            item_id += 1
+else:
+    _price_kernel = None
 
-    items_df = pd.DataFrame(items)
-    order_totals_series = pd.Series(order_totals)
-    return items_df, order_totals_series
 
+def generate_order_items(
+    orders: Dict[str, np.ndarray],
+    products: Dict[str, np.ndarray],
+    rng: np.random.Generator,
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    print("Generating order items...")
 
-def generate_payments(orders_df: pd.DataFrame, faker: Faker) -> pd.DataFrame:
+    order_ids = np.asarray(orders["order_id"])
+    product_id_arr = np.asarray(products["product_id"])
+    price_arr = np.asarray(products["price"])
+
+    n_items = rng.integers(1, 6, size=len(order_ids))
+    order_ids_rep = np.repeat(order_ids, n_items)
+    total_items = int(n_items.sum())
+
+    prod_idx = rng.integers(0, len(product_id_arr), size=total_items)
+    product_ids = product_id_arr[prod_idx]
+    prices = price_arr[prod_idx]
+
+    if _price_kernel is not None:
+        kernel_seed = int(rng.integers(0, 2**31 - 1))
+        quantities, unit_prices, line_totals = _price_kernel(prices, kernel_seed)
+    else:
+        quantities = rng.integers(1, 6, size=total_items)
+        unit_prices = np.round(rng.uniform(prices * 0.9, prices * 1.1), 2)
+        line_totals = np.round(quantities * unit_prices, 2)
+
+    items = {
+        "item_id": np.arange(1, total_items + 1),
+        "order_id": order_ids_rep,
+        "product_id": product_ids,
+        "quantity": quantities,
+        "unit_price": unit_prices,
+        "line_total": line_totals,
+    }
+    # Items are generated grouped by order (np.repeat), so the per-order
+    # totals are one reduceat over the group start offsets; the result lines
+    # up 1:1 with the orders since every order draws at least one item.
+    starts = np.concatenate(([0], np.cumsum(n_items)[:-1]))
+    order_totals = np.add.reduceat(line_totals, starts)
+    return items, order_totals
+
+
+def generate_payments(
+    orders: Dict[str, np.ndarray], rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
     print("Generating payments...")
-    payments = []
-    for order in orders_df.itertuples():
-        payment_status = random.choices(
-            PAYMENT_STATUSES, weights=[0.75, 0.15, 0.1]
-        )[0]
-        payment_method = random.choice(PAYMENT_METHODS)
-
-        payment_date = faker.date_between(
-            start_date=order.order_date, end_date="today"
-        )
 
-        if payment_status == "successful":
-            amount_paid = round(order.total_amount, 2)
-        else:
-            amount_paid = round(
-                random.uniform(1.0, max(order.total_amount, 1.0)), 2
-            )
+    order_ids = np.asarray(orders["order_id"])
+    totals = np.asarray(orders["total_amount"])
+    n = len(order_ids)
+
+    statuses = _choice_pooled(PAYMENT_STATUSES, n, rng, p=[0.75, 0.15, 0.1])
+    methods = _choice_pooled(PAYMENT_METHODS, n, rng)
+
+    order_ord = np.array(
+        [d.toordinal() for d in orders["order_date"]], dtype=np.int64
+    )
+    today_ord = date.today().toordinal()
+    payment_ordinals = rng.integers(order_ord, today_ord + 1)
+    payment_dates = np.array(
+        [date.fromordinal(int(o)) for o in payment_ordinals], dtype=object
+    )
+
+    amounts = np.where(
+        statuses == "successful",
+        np.round(totals, 2),
+        np.round(rng.uniform(1.0, np.maximum(totals, 1.0)), 2),
+    )
+    amounts = np.maximum(amounts, 0.01)
+
+    return {
+        "payment_id": order_ids,
+        "order_id": order_ids,
+        "payment_method": methods,
+        "payment_status": statuses,
+        "payment_date": payment_dates,
+        "amount_paid": amounts,
+    }
 
-        payments.append(
-            {
-                "payment_id": order.order_id,
-                "order_id": order.order_id,
-                "payment_method": payment_method,
-                "payment_status": payment_status,
-                "payment_date": payment_date,
-                "amount_paid": max(amount_paid, 0.01),
-            }
-        )
 
-    return pd.DataFrame(payments)
+def generate_tables(
+    num_orders: int, num_users: int, num_products: int, faker: Faker, seed: int
+) -> Dict[str, Dict[str, np.ndarray]]:
+    rng = np.random.default_rng(seed)
+
+    users = generate_users(num_users, seed, rng)
+    products = generate_products(num_products, faker, rng)
+    orders = generate_orders(num_orders, users, rng)
+    order_items, order_totals = generate_order_items(orders, products, rng)
+
+    print("Updating order totals...")
+    orders["total_amount"] = order_totals.round(2)
+
+    payments = generate_payments(orders, rng)
+
+    return {
+        "users": users,
+        "products": products,
+        "orders": orders,
+        "order_items": order_items,
+        "payments": payments,
+    }
 
 
 def ensure_data_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def write_csv(path: Path, columns: Dict[str, np.ndarray]) -> None:
+    # Arrow's C++ CSV writer formats the columnar buffers directly, with no
+    # per-row Python formatting loop.
+    table = pa.table({name: pa.array(col) for name, col in columns.items()})
+    pacsv.write_csv(
+        table, path, write_options=pacsv.WriteOptions(quoting_style="needed")
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate synthetic e-commerce datasets."
@@ -168,6 +327,13 @@ def main():
         default=None,
         help="Optional random seed for reproducibility.",
     )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help="Also ingest the generated tables straight into this SQLite "
+        "database, skipping the CSV round-trip.",
+    )
     args = parser.parse_args()
 
     if args.rows <= 0:
@@ -175,7 +341,6 @@ def main():
 
     seed = args.seed if args.seed is not None else random.randint(1, 1_000_000)
     print(f"Using random seed: {seed}")
-    random.seed(seed)
     faker = Faker()
     faker.seed_instance(seed)
 
@@ -186,27 +351,26 @@ def main():
     data_dir = Path("data")
     ensure_data_dir(data_dir)
 
-    users_df = generate_users(num_users, faker)
-    products_df = generate_products(num_products, faker)
-    orders_df = generate_orders(num_orders, users_df, faker)
-    order_items_df, order_totals = generate_order_items(orders_df, products_df)
-
-    print("Updating order totals...")
-    orders_df = orders_df.set_index("order_id")
-    orders_df["total_amount"] = order_totals.round(2)
-    orders_df.reset_index(inplace=True)
-
-    payments_df = generate_payments(orders_df, faker)
+    tables = generate_tables(num_orders, num_users, num_products, faker, seed)
 
     print("Exporting CSV files...")
-    users_df.to_csv(data_dir / "users.csv", index=False)
-    products_df.to_csv(data_dir / "products.csv", index=False)
-    orders_df.to_csv(data_dir / "orders.csv", index=False)
-    order_items_df.to_csv(data_dir / "order_items.csv", index=False)
-    payments_df.to_csv(data_dir / "payments.csv", index=False)
+    for table_name, columns in tables.items():
+        write_csv(data_dir / f"{table_name}.csv", columns)
 
     print(f"Data generation complete. Files saved to {data_dir.resolve()}")
 
+    if args.db is not None:
+        print(f"Ingesting tables directly into '{args.db}'...")
+        conn = ingest_to_sqlite.get_connection(args.db)
+        try:
+            ingest_to_sqlite.drop_tables(conn)
+            ingest_to_sqlite.create_tables(conn)
+            with conn:
+                ingest_to_sqlite.ingest_arrays(conn, tables)
+            ingest_to_sqlite.create_indexes(conn)
+        finally:
+            conn.close()
+
 
 if __name__ == "__main__":
     main()